@@ -1,225 +1,193 @@
 #!/usr/bin/env python3
+import mmap
+import os
 import re
+import sys
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
-from typing import List, Dict
-import statistics
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import fsum
+from operator import itemgetter
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 
-def parse_log_line(line: str) -> Dict:
+# Basic format: [UID,GID,PID] [operation] [arguments]: [OK] [debug info] <duration (s)>
+# With timestamp prefix in this log
+_LINE_RE = re.compile(r'(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}\.\d+) \[uid:(\d+),gid:(\d+),pid:(\d+)\] (\w+) \(([^)]+)\): OK(.*?) <([\d.]+)>')
+_BYTES_RE = re.compile(r'\((\d+)\)')
+_HANDLE_RE = re.compile(r'\[handle:(\w+)\]')
+
+# Inodes with more operations than this are reported as high-activity files
+_HIGH_ACTIVITY_OPS = 100
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Upper bounds (inclusive) of the I/O size distribution buckets
+_SIZE_BUCKET_BOUNDS = (4096, 8192, 32768, 65536, 131072)
+_SIZE_BUCKET_LABELS = ('≤4KB', '≤8KB', '≤32KB', '≤64KB', '≤128KB', '>128KB')
+
+# Logs larger than this are parsed in parallel, one chunk per task
+_CHUNK_SIZE = 64 * 1024 * 1024
+
+class Operation:
+    """A parsed log line; fields an operation type does not carry are None."""
+    
+    # Slots instead of a per-instance dict: one is created for every line
+    __slots__ = ('timestamp', 'uid', 'gid', 'pid', 'operation', 'duration', 'result_debug',
+                 'args', 'inode', 'parent_inode', 'name', 'mode', 'umask', 'flags',
+                 'size', 'offset', 'handle', 'bytes_read')
+    
+    def __init__(self, timestamp: str, uid: int, gid: int, pid: int, operation: str,
+                 duration: float, result_debug: str):
+        self.timestamp = timestamp
+        self.uid = uid
+        self.gid = gid
+        self.pid = pid
+        self.operation = operation
+        self.duration = duration
+        self.result_debug = result_debug
+        self.args = self.inode = self.parent_inode = self.name = self.mode = None
+        self.umask = self.flags = self.size = self.offset = self.handle = self.bytes_read = None
+
+def parse_log_line(line: str) -> Optional[Operation]:
     """Parse a single JuiceFS log line using format from CLAUDE.md."""
-    # Basic format: [UID,GID,PID] [operation] [arguments]: [OK] [debug info] <duration (s)>
-    # With timestamp prefix in this log
-    pattern = r'(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}\.\d+) \[uid:(\d+),gid:(\d+),pid:(\d+)\] (\w+) \(([^)]+)\): OK(.*?) <([\d.]+)>'
+    line = line.strip()
+    # Both literals are required by the line format; skip noise lines
+    # (banners, stack traces, failed ops) before running the regex
+    if '[uid:' not in line or '): OK' not in line:
+        return None
     
-    match = re.match(pattern, line.strip())
+    match = _LINE_RE.match(line)
     if not match:
         return None
     
     timestamp, uid, gid, pid, operation, args, result_debug, duration = match.groups()
+    # Operation names repeat on every line; interning shares one object per
+    # name, so the == checks and dict lookups below hit the identity fast path
+    operation = sys.intern(operation)
+    
+    parsed = Operation(timestamp, int(uid), int(gid), int(pid), operation,
+                       float(duration), result_debug.strip())
+    
+    if operation == 'read' or operation == 'write':
+        # read/write, arguments (inode, size, offset, file-handler)
+        # These make up most of the log, so the four integers are sliced out
+        # directly instead of building an args list (int() ignores spaces)
+        c1 = args.find(',')
+        c2 = args.find(',', c1 + 1)
+        c3 = args.find(',', c2 + 1)
+        if c1 >= 0 and c2 >= 0 and c3 >= 0:
+            c4 = args.find(',', c3 + 1)
+            parsed.inode = int(args[:c1])
+            parsed.size = int(args[c1 + 1:c2])
+            parsed.offset = int(args[c2 + 1:c3])
+            parsed.handle = int(args[c3 + 1:c4] if c4 >= 0 else args[c3 + 1:])
+            if operation == 'read':
+                # Extract bytes read from result
+                result_match = _BYTES_RE.search(result_debug)
+                parsed.bytes_read = int(result_match.group(1)) if result_match else parsed.size
+        return parsed
     
     # Parse arguments based on operation type from CLAUDE.md specs
     args_list = [arg.strip() for arg in args.split(',')]
-    
-    parsed = {
-        'timestamp': timestamp,
-        'uid': int(uid),
-        'gid': int(gid),
-        'pid': int(pid),
-        'operation': operation,
-        'duration': float(duration),
-        'args': args_list,
-        'result_debug': result_debug.strip()
-    }
+    parsed.args = args_list
     
     # Parse operation-specific arguments according to CLAUDE.md format
-    if operation == 'read' and len(args_list) >= 4:
-        # read, arguments (inode, size, offset, file-handler)
-        parsed['inode'] = int(args_list[0])
-        parsed['size'] = int(args_list[1])
-        parsed['offset'] = int(args_list[2])
-        parsed['handle'] = int(args_list[3])
-        # Extract bytes read from result
-        result_match = re.search(r'\((\d+)\)', result_debug)
-        parsed['bytes_read'] = int(result_match.group(1)) if result_match else parsed['size']
-    
-    elif operation == 'open' and len(args_list) >= 2:
+    if operation == 'open' and len(args_list) >= 2:
         # open, arguments (inode, flags)
-        parsed['inode'] = int(args_list[0])
-        parsed['flags'] = args_list[1]
+        parsed.inode = int(args_list[0])
+        parsed.flags = args_list[1]
         # Extract handle from debug info
-        handle_match = re.search(r'\[handle:(\w+)\]', result_debug)
-        parsed['handle'] = handle_match.group(1) if handle_match else None
+        handle_match = _HANDLE_RE.search(result_debug)
+        parsed.handle = handle_match.group(1) if handle_match else None
     
     elif operation == 'getattr' and len(args_list) >= 1:
         # getattr, arguments (inode)
-        parsed['inode'] = int(args_list[0]) if args_list[0].isdigit() else None
+        parsed.inode = int(args_list[0]) if args_list[0].isdigit() else None
         if len(args_list) > 1:
-            parsed['flags'] = args_list[1]
+            parsed.flags = args_list[1]
     
     elif operation == 'create' and len(args_list) >= 4:
         # create, arguments (parent-inode, name, mode, umask)
-        parsed['parent_inode'] = int(args_list[0])
-        parsed['name'] = args_list[1]
-        parsed['mode'] = args_list[2]
-        parsed['umask'] = args_list[3] if len(args_list) > 3 else None
-    
-    elif operation == 'write' and len(args_list) >= 4:
-        # write, arguments (inode, size, offset, file-handler)
-        parsed['inode'] = int(args_list[0])
-        parsed['size'] = int(args_list[1])
-        parsed['offset'] = int(args_list[2])
-        parsed['handle'] = int(args_list[3])
+        parsed.parent_inode = int(args_list[0])
+        parsed.name = args_list[1]
+        parsed.mode = args_list[2]
+        parsed.umask = args_list[3] if len(args_list) > 3 else None
     
     elif operation == 'unlink' and len(args_list) >= 2:
         # unlink, arguments (parent-inode, name)
-        parsed['parent_inode'] = int(args_list[0])
-        parsed['name'] = args_list[1]
+        parsed.parent_inode = int(args_list[0])
+        parsed.name = args_list[1]
     
     elif operation == 'flush' and len(args_list) >= 2:
         # flush, arguments (inode, file-handler)
-        parsed['inode'] = int(args_list[0])
-        parsed['handle'] = int(args_list[1])
+        parsed.inode = int(args_list[0])
+        parsed.handle = int(args_list[1])
     
     elif operation in ['lookup', 'statfs']:
         # These operations typically have inode as first argument
         if args_list and args_list[0].isdigit():
-            parsed['inode'] = int(args_list[0])
+            parsed.inode = int(args_list[0])
     
     return parsed
 
-def analyze_io_behavior(operations: List[Dict]) -> Dict:
-    """Analyze detailed I/O behavior patterns."""
-    if not operations:
-        return {}
-    
-    # Analyze file handle usage
-    handle_usage = defaultdict(int)
-    inode_operations = defaultdict(int)
-    operation_timestamps = []
-    raw_timestamps = []
-    
-    for op in operations:
-        if 'handle' in op and op['handle']:
-            handle_usage[op['handle']] += 1
-        if 'inode' in op and op['inode']:
-            inode_operations[op['inode']] += 1
-        
-        # Parse timestamp for temporal analysis
-        try:
-            timestamp_str = op['timestamp']
-            raw_timestamps.append(timestamp_str)
-            
-            # Convert to seconds for gap calculation
-            time_parts = timestamp_str.split(' ')[1].split('.')
-            time_part = time_parts[0]
-            microsec = int(time_parts[1]) if len(time_parts) > 1 else 0
-            
-            hour, minute, second = map(int, time_part.split(':'))
-            total_seconds = hour * 3600 + minute * 60 + second + microsec / 1000000.0
-            operation_timestamps.append(total_seconds)
-        except:
-            pass
-    
-    # Calculate time span and operation rate
-    time_span_seconds = 0
-    ops_per_second = 0
-    start_time = ""
-    end_time = ""
-    
-    if raw_timestamps:
-        start_time = min(raw_timestamps)
-        end_time = max(raw_timestamps)
-        
-        if len(operation_timestamps) > 1:
-            operation_timestamps.sort()
-            time_span_seconds = operation_timestamps[-1] - operation_timestamps[0]
-            if time_span_seconds > 0:
-                ops_per_second = len(operations) / time_span_seconds
-    
-    # Calculate temporal gaps
-    temporal_gaps = []
-    if len(operation_timestamps) > 1:
-        operation_timestamps.sort()
-        for i in range(1, len(operation_timestamps)):
-            gap = operation_timestamps[i] - operation_timestamps[i-1]
-            if gap > 0:  # Only positive gaps
-                temporal_gaps.append(gap)
-    
-    # Count high-activity files (>100 operations)
-    high_activity_files = sum(1 for count in inode_operations.values() if count > 100)
-    
-    return {
-        'unique_handles': len(handle_usage),
-        'avg_ops_per_handle': statistics.mean(handle_usage.values()) if handle_usage else 0,
-        'high_activity_files': high_activity_files,
-        'temporal_gaps': len(temporal_gaps),
-        'max_gap': max(temporal_gaps) if temporal_gaps else 0,
-        'avg_gap': statistics.mean(temporal_gaps) if temporal_gaps else 0,
-        'time_span_seconds': time_span_seconds,
-        'ops_per_second': ops_per_second,
-        'start_time': start_time,
-        'end_time': end_time
-    }
+def analyze_access_pattern(inode_io: Dict[int, List[Tuple[str, int, int, str]]]) -> Dict:
+    """Analyze access pattern and return detailed statistics.
 
-def analyze_access_pattern(operations: List[Dict]) -> Dict:
-    """Analyze access pattern and return detailed statistics."""
-    io_ops = [op for op in operations if op['operation'] in ['read', 'write'] and 'offset' in op]
-    
-    if len(io_ops) < 2:
-        return {
-            'pattern': 'insufficient_data',
-            'sequential_percentage': 0,
-            'random_percentage': 0,
-            'total_transitions': 0
-        }
-    
-    # Group by inode
-    by_inode = defaultdict(list)
-    for op in io_ops:
-        by_inode[op['inode']].append(op)
-    
+    ``inode_io`` maps each inode to its read and write operations, recorded
+    as ``(timestamp, offset, size, operation)`` tuples in log order.
+    """
+    io_op_count = 0
     sequential_count = 0
     random_count = 0
     backward_seeks = 0
     forward_seeks = 0
-    seek_distances = []
+    seek_distance_sum = 0
+    max_seek_distance = 0
     
-    for ops in by_inode.values():
+    for ops in inode_io.values():
+        io_op_count += len(ops)
         if len(ops) < 2:
             continue
-            
-        # Sort by timestamp
-        ops.sort(key=lambda x: x['timestamp'])
         
-        # Analyze consecutive reads
+        # Sort by timestamp: concurrent requests are often logged slightly
+        # out of time order. Sorting a copy leaves inode_io in log order.
+        ops = sorted(ops, key=itemgetter(0))
+        
+        # Analyze consecutive reads/writes
         for i in range(1, len(ops)):
-            prev_op = ops[i-1]
-            curr_op = ops[i]
-            
-            prev_end = prev_op['offset'] + prev_op['size']
-            curr_start = curr_op['offset']
+            _, prev_offset, prev_size, _ = ops[i-1]
+            _, curr_start, _, _ = ops[i]
             
             # Calculate seek distance
-            seek_distance = abs(curr_start - prev_end)
-            seek_distances.append(seek_distance)
+            seek_distance = abs(curr_start - (prev_offset + prev_size))
+            seek_distance_sum += seek_distance
+            if seek_distance > max_seek_distance:
+                max_seek_distance = seek_distance
             
             # Determine access pattern
-            if seek_distance <= prev_op['size']:  # Allow some overlap tolerance
+            if seek_distance <= prev_size:  # Allow some overlap tolerance
                 sequential_count += 1
             else:
                 random_count += 1
                 # Track seek direction
-                if curr_start < prev_op['offset']:
+                if curr_start < prev_offset:
                     backward_seeks += 1
                 else:
                     forward_seeks += 1
     
     total_transitions = sequential_count + random_count
-    if total_transitions == 0:
+    if io_op_count < 2 or total_transitions == 0:
         return {
-            'pattern': 'unknown',
+            'pattern': 'insufficient_data' if io_op_count < 2 else 'unknown',
             'sequential_percentage': 0,
             'random_percentage': 0,
-            'total_transitions': 0
+            'total_transitions': 0,
+            'backward_seeks': 0,
+            'forward_seeks': 0,
+            'avg_seek_distance': 0,
+            'max_seek_distance': 0
         }
     
     seq_percentage = (sequential_count / total_transitions) * 100
@@ -240,58 +208,56 @@ def analyze_access_pattern(operations: List[Dict]) -> Dict:
         'total_transitions': total_transitions,
         'backward_seeks': backward_seeks,
         'forward_seeks': forward_seeks,
-        'avg_seek_distance': statistics.mean(seek_distances) if seek_distances else 0,
-        'max_seek_distance': max(seek_distances) if seek_distances else 0
+        # One seek distance is measured per transition
+        'avg_seek_distance': seek_distance_sum / total_transitions,
+        'max_seek_distance': max_seek_distance
     }
 
-def analyze_continuous_operations(operations: List[Dict]) -> Dict:
-    """Analyze inodes with continuous read or write operations."""
-    # Group operations by inode
-    inode_ops = defaultdict(list)
-    for op in operations:
-        if op['operation'] in ['read', 'write'] and 'inode' in op and 'offset' in op:
-            inode_ops[op['inode']].append(op)
-    
+def analyze_continuous_operations(inode_io: Dict[int, List[Tuple[str, int, int, str]]]) -> Dict:
+    """Analyze inodes with continuous read or write operations.
+
+    ``inode_io`` maps each inode to its read and write operations, recorded
+    as ``(timestamp, offset, size, operation)`` tuples in log order.
+    """
     continuous_inodes = {
         'read': [],
         'write': []
     }
     
-    for inode, ops in inode_ops.items():
+    for inode, ops in inode_io.items():
         if len(ops) < 3:  # Need at least 3 ops to determine continuity
             continue
-            
+        
         # Separate reads and writes
-        reads = [op for op in ops if op['operation'] == 'read']
-        writes = [op for op in ops if op['operation'] == 'write']
+        reads = [op for op in ops if op[3] == 'read']
+        writes = [op for op in ops if op[3] == 'write']
         
         def check_continuity(op_list, op_type):
             if len(op_list) < 3:
                 return
                 
             # Sort by timestamp
-            op_list.sort(key=lambda x: x['timestamp'])
+            op_list.sort(key=itemgetter(0))
             
             continuous_count = 0
             total_bytes = 0
             
             # Check for continuous operations (sequential offsets)
             for i in range(1, len(op_list)):
-                prev_op = op_list[i-1]
-                curr_op = op_list[i]
+                _, prev_offset, prev_size, _ = op_list[i-1]
+                _, curr_start, curr_size, _ = op_list[i]
                 
-                prev_end = prev_op['offset'] + prev_op['size']
-                curr_start = curr_op['offset']
+                prev_end = prev_offset + prev_size
                 
                 # Consider continuous if current starts within tolerance of previous end
-                if abs(curr_start - prev_end) <= prev_op['size']:
+                if abs(curr_start - prev_end) <= prev_size:
                     continuous_count += 1
-                    total_bytes += curr_op['size']
+                    total_bytes += curr_size
             
             # If more than 50% of transitions are continuous, consider it continuous
             if continuous_count > len(op_list) * 0.5:
-                avg_size = sum(op['size'] for op in op_list) / len(op_list)
-                sizes = [op['size'] for op in op_list]
+                sizes = [op[2] for op in op_list]
+                avg_size = sum(sizes) / len(op_list)
                 
                 # Get top 3 operation sizes by frequency
                 from collections import Counter
@@ -317,260 +283,469 @@ def analyze_continuous_operations(operations: List[Dict]) -> Dict:
     
     return continuous_inodes
 
+def bucket_sizes(sizes) -> List[Tuple[str, int]]:
+    """Count I/O sizes per size bucket, returning non-empty buckets in order."""
+    counts = [0] * len(_SIZE_BUCKET_LABELS)
+    for size in sizes:
+        counts[bisect_left(_SIZE_BUCKET_BOUNDS, size)] += 1
+    return [(label, count) for label, count in zip(_SIZE_BUCKET_LABELS, counts) if count]
+
+def _mean(values) -> float:
+    """Arithmetic mean; fsum keeps float sums accurate without statistics' Fraction overhead."""
+    return fsum(values) / len(values)
+
+def _median(values):
+    """Median of values, averaging the two middle values for even counts."""
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
 def format_size(size_bytes: int) -> str:
     """Format size in human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f}{unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f}TB"
+    # Each unit is a further 10 bits, so the unit index follows directly
+    # from the bit length instead of repeated division by 1024
+    shift = min((max(size_bytes, 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (shift * 10)):.1f}{_SIZE_UNITS[shift]}"
 
-def analyze_log(file_path: str):
-    """Main analysis function."""
-    operations = []
+def collect_stats(lines: Iterable[str]) -> Dict:
+    """Accumulate all log statistics in a single streaming pass over lines.
+
+    Parsed operations are never held in memory at once; the returned dict
+    holds counters and per-inode state that merge_stats() can combine
+    across consecutive chunks of the same log.
+    """
+    total_ops = 0
+    op_counts = defaultdict(int)
+    total_read_bytes = 0
+    total_write_bytes = 0
+    # Numeric columns are kept as unboxed typed arrays rather than lists of
+    # Python int/float objects
+    read_sizes = array('q')
+    write_sizes = array('q')
+    durations = array('d')
+    inodes = set()
+    
+    # I/O behavior
+    handle_usage = defaultdict(int)
+    inode_operations = defaultdict(int)
+    high_activity_files = 0
+    # Seconds-of-day of every operation, packed 8 bytes each
+    operation_timestamps = array('d')
+    # Time span bounds, tracked as lines arrive (logs are near-sorted, so
+    # these rarely change after the first line)
+    start_time = None
+    end_time = None
+    min_seconds = float('inf')
+    max_seconds = float('-inf')
+    
+    # Access pattern and continuous operations:
+    # (timestamp, offset, size, operation) per inode, in log order
+    inode_io = defaultdict(list)
+    
+    # Bind every per-line callable and global to a local once; this loop
+    # runs for every line of the log, so global/attribute lookups add up.
+    # The counter dicts are already locals and are updated by subscript.
+    parse = parse_log_line
+    to_int = int
+    add_duration = durations.append
+    add_read_size = read_sizes.append
+    add_write_size = write_sizes.append
+    add_inode = inodes.add
+    add_operation_timestamp = operation_timestamps.append
+    high_activity_count = _HIGH_ACTIVITY_OPS + 1
+    
+    for line in lines:
+        op = parse(line)
+        if not op:
+            continue
+        
+        total_ops += 1
+        operation = op.operation
+        op_counts[operation] += 1
+        add_duration(op.duration)
+        
+        size = op.size
+        if operation == 'read' and size is not None:
+            add_read_size(size)
+            total_read_bytes += op.bytes_read
+        elif operation == 'write' and size is not None:
+            add_write_size(size)
+            total_write_bytes += size
+        
+        inode = op.inode
+        if inode is not None:
+            add_inode(inode)
+            if inode:
+                count = inode_operations[inode] + 1
+                inode_operations[inode] = count
+                if count == high_activity_count:
+                    high_activity_files += 1
+        
+        handle = op.handle
+        if handle:
+            handle_usage[handle] += 1
+        
+        # Parse timestamp for temporal analysis
+        timestamp_str = op.timestamp
+        if start_time is None:
+            start_time = end_time = timestamp_str
+        elif timestamp_str > end_time:
+            end_time = timestamp_str
+        elif timestamp_str < start_time:
+            start_time = timestamp_str
+        
+        # Convert to seconds for gap calculation; _LINE_RE only matches the
+        # fixed-width YYYY.MM.DD HH:MM:SS.uuuuuu form, so this cannot fail
+        total_seconds = (to_int(timestamp_str[11:13]) * 3600 + to_int(timestamp_str[14:16]) * 60
+                         + to_int(timestamp_str[17:19]) + to_int(timestamp_str[20:]) / 1000000.0)
+        add_operation_timestamp(total_seconds)
+        if total_seconds < min_seconds:
+            min_seconds = total_seconds
+        if total_seconds > max_seconds:
+            max_seconds = total_seconds
+        
+        if op.offset is not None:
+            inode_io[inode].append((timestamp_str, op.offset, size, operation))
     
+    return {
+        'total_ops': total_ops,
+        'op_counts': op_counts,
+        'total_read_bytes': total_read_bytes,
+        'total_write_bytes': total_write_bytes,
+        'read_sizes': read_sizes,
+        'write_sizes': write_sizes,
+        'durations': durations,
+        'inodes': inodes,
+        'handle_usage': handle_usage,
+        'inode_operations': inode_operations,
+        'high_activity_files': high_activity_files,
+        'operation_timestamps': operation_timestamps,
+        'start_time': start_time,
+        'end_time': end_time,
+        'min_seconds': min_seconds,
+        'max_seconds': max_seconds,
+        'inode_io': inode_io
+    }
+
+def merge_stats(partials: List[Dict]) -> Dict:
+    """Merge collect_stats() results of consecutive log chunks, in log order."""
+    merged = partials[0]
+    for part in partials[1:]:
+        for key in ('total_ops', 'total_read_bytes', 'total_write_bytes'):
+            merged[key] += part[key]
+        for key in ('read_sizes', 'write_sizes', 'durations',
+                    'operation_timestamps'):
+            merged[key].extend(part[key])
+        for key in ('op_counts', 'handle_usage'):
+            counts = merged[key]
+            for name, count in part[key].items():
+                counts[name] += count
+        # An inode can cross the high-activity threshold only once merged
+        inode_operations = merged['inode_operations']
+        for inode, count in part['inode_operations'].items():
+            before = inode_operations[inode]
+            inode_operations[inode] = before + count
+            if before <= _HIGH_ACTIVITY_OPS < before + count:
+                merged['high_activity_files'] += 1
+        for inode, ops in part['inode_io'].items():
+            merged['inode_io'][inode].extend(ops)
+        merged['inodes'] |= part['inodes']
+        if part['start_time'] is not None:
+            if merged['start_time'] is None or part['start_time'] < merged['start_time']:
+                merged['start_time'] = part['start_time']
+            if merged['end_time'] is None or part['end_time'] > merged['end_time']:
+                merged['end_time'] = part['end_time']
+        merged['min_seconds'] = min(merged['min_seconds'], part['min_seconds'])
+        merged['max_seconds'] = max(merged['max_seconds'], part['max_seconds'])
+    return merged
+
+def iter_log_lines(file_path: str) -> Iterator[str]:
+    """Yield the lines of a log file.
+
+    Undecodable bytes (e.g. in file names) are replaced rather than
+    aborting the whole analysis.
+    """
+    with open(file_path, 'r', errors='replace') as f:
+        yield from f
+
+def _chunk_bounds(file_path: str, chunk_size: int = _CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Split a file into byte ranges of about chunk_size, aligned to line starts."""
+    file_size = os.path.getsize(file_path)
+    if file_size <= chunk_size:
+        return [(0, file_size)]
+    
+    bounds = []
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < file_size:
+            newline = mm.find(b'\n', start + chunk_size)
+            end = file_size if newline < 0 else newline + 1
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+def _collect_chunk_stats(file_path: str, start: int, end: int) -> Dict:
+    """Worker entry point: collect statistics for one byte range of a log.
+
+    The whole range is decoded and split in single C calls rather than
+    line by line.
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        lines = f.read(end - start).decode('utf-8', 'replace').splitlines()
+    return collect_stats(lines)
+
+def collect_log_stats(file_path: str, workers: Optional[int] = None) -> Dict:
+    """Collect statistics for a whole log file.
+
+    Files larger than one chunk are split on line boundaries and parsed in
+    parallel worker processes; partial results are merged in file order.
+    """
+    bounds = _chunk_bounds(file_path)
+    if len(bounds) == 1 or workers == 1:
+        return collect_stats(iter_log_lines(file_path))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = list(executor.map(_collect_chunk_stats, repeat(file_path),
+                                     [start for start, _ in bounds],
+                                     [end for _, end in bounds]))
+    return merge_stats(partials)
+
+def analyze_log(file_path: str, workers: Optional[int] = None):
+    """Main analysis function."""
     print(f"Analyzing log file: {file_path}")
     print("=" * 80)
     
-    with open(file_path, 'r') as f:
-        for line in f:
-            parsed = parse_log_line(line)
-            if parsed:
-                operations.append(parsed)
-    
-    if not operations:
+    stats = collect_log_stats(file_path, workers)
+    total_ops = stats['total_ops']
+    if not total_ops:
         print("No valid operations found in log file")
         return
     
-    # Basic statistics
-    op_counts = defaultdict(int)
-    total_read_bytes = 0
-    total_write_bytes = 0
-    read_sizes = []
-    write_sizes = []
-    durations = []
-    inodes = set()
+    op_counts = stats['op_counts']
+    total_read_bytes = stats['total_read_bytes']
+    total_write_bytes = stats['total_write_bytes']
+    read_sizes = stats['read_sizes']
+    write_sizes = stats['write_sizes']
+    durations = stats['durations']
+    inodes = stats['inodes']
+    handle_usage = stats['handle_usage']
+    operation_timestamps = stats['operation_timestamps']
     
-    for op in operations:
-        op_counts[op['operation']] += 1
-        durations.append(op['duration'])
-        
-        if op['operation'] == 'read' and 'size' in op:
-            read_sizes.append(op['size'])
-            total_read_bytes += op.get('bytes_read', op['size'])
-        elif op['operation'] == 'write' and 'size' in op:
-            write_sizes.append(op['size'])
-            total_write_bytes += op['size']
-        
-        if 'inode' in op:
-            inodes.add(op['inode'])
+    access_analysis = analyze_access_pattern(stats['inode_io'])
     
-    # Analyze access pattern and I/O behavior
-    access_analysis = analyze_access_pattern(operations)
+    # Calculate time span and operation rate
+    time_span_seconds = 0
+    ops_per_second = 0
+    start_time = stats['start_time'] or ""
+    end_time = stats['end_time'] or ""
+    
+    if stats['max_seconds'] > stats['min_seconds']:
+        time_span_seconds = stats['max_seconds'] - stats['min_seconds']
+        ops_per_second = total_ops / time_span_seconds
+    
+    # Calculate temporal gaps: sort once (log order is only nearly sorted),
+    # then walk the sorted seconds keeping running gap statistics
+    gap_count = 0
+    gap_sum = 0.0
+    max_gap = 0
+    prev_seconds = None
+    for seconds in sorted(operation_timestamps):
+        if prev_seconds is not None:
+            gap = seconds - prev_seconds
+            if gap > 0:  # Only positive gaps
+                gap_count += 1
+                gap_sum += gap
+                if gap > max_gap:
+                    max_gap = gap
+        prev_seconds = seconds
     
-    # Additional I/O behavior analysis
-    io_analysis = analyze_io_behavior(operations)
+    io_analysis = {
+        'unique_handles': len(handle_usage),
+        'avg_ops_per_handle': _mean(handle_usage.values()) if handle_usage else 0,
+        'high_activity_files': stats['high_activity_files'],
+        'temporal_gaps': gap_count,
+        'max_gap': max_gap,
+        'avg_gap': gap_sum / gap_count if gap_count else 0,
+        'time_span_seconds': time_span_seconds,
+        'ops_per_second': ops_per_second,
+        'start_time': start_time,
+        'end_time': end_time
+    }
     
     # Analyze continuous operations
-    continuous_analysis = analyze_continuous_operations(operations)
-    
-    # Print ASCII table
-    print("┌─────────────────────────────────────────────────────────────────────────────┐")
-    print("│                            LOG ANALYSIS SUMMARY                            │")
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
-    print(f"│ Total Operations        │ {len(operations):>45} │")
-    print(f"│ Unique Inodes          │ {len(inodes):>45} │")
+    continuous_analysis = analyze_continuous_operations(stats['inode_io'])
+    
+    # Build the whole report and write it to stdout in one call
+    out = []
+    out.append("┌─────────────────────────────────────────────────────────────────────────────┐")
+    out.append("│                            LOG ANALYSIS SUMMARY                            │")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append(f"│ Total Operations        │ {total_ops:>45} │")
+    out.append(f"│ Unique Inodes          │ {len(inodes):>45} │")
     if io_analysis and io_analysis['start_time'] and io_analysis['end_time']:
-        print(f"│ Time Span Start        │ {io_analysis['start_time']:>45} │")
-        print(f"│ Time Span End          │ {io_analysis['end_time']:>45} │")
+        out.append(f"│ Time Span Start        │ {io_analysis['start_time']:>45} │")
+        out.append(f"│ Time Span End          │ {io_analysis['end_time']:>45} │")
         if io_analysis['time_span_seconds'] > 0:
             span_minutes = io_analysis['time_span_seconds'] / 60
             span_hours = span_minutes / 60
             if span_hours >= 1:
-                print(f"│ Total Time Span        │ {span_hours:>42.2f}h │")
+                out.append(f"│ Total Time Span        │ {span_hours:>42.2f}h │")
             elif span_minutes >= 1:
-                print(f"│ Total Time Span        │ {span_minutes:>42.2f}m │")
+                out.append(f"│ Total Time Span        │ {span_minutes:>42.2f}m │")
             else:
-                print(f"│ Total Time Span        │ {io_analysis['time_span_seconds']:>42.2f}s │")
-            print(f"│ Operations per Second  │ {io_analysis['ops_per_second']:>42.1f} │")
-    print(f"│ Access Pattern         │ {access_analysis['pattern'].upper():>45} │")
-    print(f"│ Sequential Access      │ {access_analysis['sequential_percentage']:>42.1f}% │")
-    print(f"│ Random Access          │ {access_analysis['random_percentage']:>42.1f}% │")
-    print(f"│ Total Data Read        │ {format_size(total_read_bytes):>45} │")
+                out.append(f"│ Total Time Span        │ {io_analysis['time_span_seconds']:>42.2f}s │")
+            out.append(f"│ Operations per Second  │ {io_analysis['ops_per_second']:>42.1f} │")
+    out.append(f"│ Access Pattern         │ {access_analysis['pattern'].upper():>45} │")
+    out.append(f"│ Sequential Access      │ {access_analysis['sequential_percentage']:>42.1f}% │")
+    out.append(f"│ Random Access          │ {access_analysis['random_percentage']:>42.1f}% │")
+    out.append(f"│ Total Data Read        │ {format_size(total_read_bytes):>45} │")
     if total_write_bytes > 0:
-        print(f"│ Total Data Written     │ {format_size(total_write_bytes):>45} │")
+        out.append(f"│ Total Data Written     │ {format_size(total_write_bytes):>45} │")
     total_bytes = total_read_bytes + total_write_bytes
     if total_bytes > 0:
-        print(f"│ Total Data Transfer    │ {format_size(total_bytes):>45} │")
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
-    print("│                           OPERATION BREAKDOWN                               │")
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
+        out.append(f"│ Total Data Transfer    │ {format_size(total_bytes):>45} │")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append("│                           OPERATION BREAKDOWN                               │")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
     
     for op_type, count in sorted(op_counts.items()):
-        percentage = (count / len(operations)) * 100
-        print(f"│ {op_type.capitalize():<18} │ {count:>8} ({percentage:>5.1f}%) │ {'█' * int(percentage/2):>25} │")
+        percentage = (count / total_ops) * 100
+        out.append(f"│ {op_type.capitalize():<18} │ {count:>8} ({percentage:>5.1f}%) │ {'█' * int(percentage/2):>25} │")
     
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
-    print("│                              I/O STATISTICS                                │")
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append("│                              I/O STATISTICS                                │")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
     
     if read_sizes:
-        print(f"│ Total Reads            │ {len(read_sizes):>45} │")
-        print(f"│ Min Read Size          │ {format_size(min(read_sizes)):>45} │")
-        print(f"│ Max Read Size          │ {format_size(max(read_sizes)):>45} │")
-        print(f"│ Avg Read Size          │ {format_size(int(statistics.mean(read_sizes))):>45} │")
-        print(f"│ Median Read Size       │ {format_size(int(statistics.median(read_sizes))):>45} │")
+        out.append(f"│ Total Reads            │ {len(read_sizes):>45} │")
+        out.append(f"│ Min Read Size          │ {format_size(min(read_sizes)):>45} │")
+        out.append(f"│ Max Read Size          │ {format_size(max(read_sizes)):>45} │")
+        out.append(f"│ Avg Read Size          │ {format_size(int(_mean(read_sizes))):>45} │")
+        out.append(f"│ Median Read Size       │ {format_size(int(_median(read_sizes))):>45} │")
     
     if write_sizes:
-        print(f"│ Total Writes           │ {len(write_sizes):>45} │")
-        print(f"│ Min Write Size         │ {format_size(min(write_sizes)):>45} │")
-        print(f"│ Max Write Size         │ {format_size(max(write_sizes)):>45} │")
-        print(f"│ Avg Write Size         │ {format_size(int(statistics.mean(write_sizes))):>45} │")
-        print(f"│ Median Write Size      │ {format_size(int(statistics.median(write_sizes))):>45} │")
+        out.append(f"│ Total Writes           │ {len(write_sizes):>45} │")
+        out.append(f"│ Min Write Size         │ {format_size(min(write_sizes)):>45} │")
+        out.append(f"│ Max Write Size         │ {format_size(max(write_sizes)):>45} │")
+        out.append(f"│ Avg Write Size         │ {format_size(int(_mean(write_sizes))):>45} │")
+        out.append(f"│ Median Write Size      │ {format_size(int(_median(write_sizes))):>45} │")
     
     # Read/Write ratio
     total_io_ops = len(read_sizes) + len(write_sizes)
     if total_io_ops > 0:
         read_percentage = (len(read_sizes) / total_io_ops) * 100
         write_percentage = (len(write_sizes) / total_io_ops) * 100
-        print(f"│ Read/Write Ratio       │ {read_percentage:>39.1f}% / {write_percentage:.1f}% │")
+        out.append(f"│ Read/Write Ratio       │ {read_percentage:>39.1f}% / {write_percentage:.1f}% │")
     
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
-    print("│                           PERFORMANCE METRICS                              │")
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
-    print(f"│ Min Duration           │ {min(durations):>42.6f}s │")
-    print(f"│ Max Duration           │ {max(durations):>42.6f}s │")
-    print(f"│ Avg Duration           │ {statistics.mean(durations):>42.6f}s │")
-    print(f"│ Median Duration        │ {statistics.median(durations):>42.6f}s │")
-    print(f"│ Total Duration         │ {sum(durations):>42.3f}s │")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append("│                           PERFORMANCE METRICS                              │")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append(f"│ Min Duration           │ {min(durations):>42.6f}s │")
+    out.append(f"│ Max Duration           │ {max(durations):>42.6f}s │")
+    out.append(f"│ Avg Duration           │ {_mean(durations):>42.6f}s │")
+    out.append(f"│ Median Duration        │ {_median(durations):>42.6f}s │")
+    out.append(f"│ Total Duration         │ {sum(durations):>42.3f}s │")
     
     if total_bytes > 0:
         total_time = sum(durations)
         throughput = total_bytes / total_time if total_time > 0 else 0
-        print(f"│ Avg Throughput         │ {format_size(int(throughput)):>42}/s │")
+        out.append(f"│ Avg Throughput         │ {format_size(int(throughput)):>42}/s │")
         
         if total_read_bytes > 0:
             read_throughput = total_read_bytes / total_time if total_time > 0 else 0
-            print(f"│ Read Throughput        │ {format_size(int(read_throughput)):>42}/s │")
+            out.append(f"│ Read Throughput        │ {format_size(int(read_throughput)):>42}/s │")
         
         if total_write_bytes > 0:
             write_throughput = total_write_bytes / total_time if total_time > 0 else 0
-            print(f"│ Write Throughput       │ {format_size(int(write_throughput)):>42}/s │")
-    
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
-    print("│                              I/O BEHAVIOR                                  │")
-    print("├─────────────────────────────────────────────────────────────────────────────┤")
-    print(f"│ Total Transitions      │ {access_analysis['total_transitions']:>45} │")
-    print(f"│ Backward Seeks         │ {access_analysis['backward_seeks']:>45} │")
-    print(f"│ Forward Seeks          │ {access_analysis['forward_seeks']:>45} │")
+            out.append(f"│ Write Throughput       │ {format_size(int(write_throughput)):>42}/s │")
+    
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append("│                              I/O BEHAVIOR                                  │")
+    out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+    out.append(f"│ Total Transitions      │ {access_analysis['total_transitions']:>45} │")
+    out.append(f"│ Backward Seeks         │ {access_analysis['backward_seeks']:>45} │")
+    out.append(f"│ Forward Seeks          │ {access_analysis['forward_seeks']:>45} │")
     if access_analysis['avg_seek_distance'] > 0:
-        print(f"│ Avg Seek Distance      │ {format_size(int(access_analysis['avg_seek_distance'])):>45} │")
-        print(f"│ Max Seek Distance      │ {format_size(int(access_analysis['max_seek_distance'])):>45} │")
+        out.append(f"│ Avg Seek Distance      │ {format_size(int(access_analysis['avg_seek_distance'])):>45} │")
+        out.append(f"│ Max Seek Distance      │ {format_size(int(access_analysis['max_seek_distance'])):>45} │")
     
     if io_analysis:
-        print(f"│ Unique File Handles    │ {io_analysis['unique_handles']:>45} │")
-        print(f"│ Avg Ops per Handle     │ {io_analysis['avg_ops_per_handle']:>42.1f} │")
-        print(f"│ Files with >100 Ops    │ {io_analysis['high_activity_files']:>45} │")
+        out.append(f"│ Unique File Handles    │ {io_analysis['unique_handles']:>45} │")
+        out.append(f"│ Avg Ops per Handle     │ {io_analysis['avg_ops_per_handle']:>42.1f} │")
+        out.append(f"│ Files with >100 Ops    │ {io_analysis['high_activity_files']:>45} │")
         if io_analysis['temporal_gaps']:
-            print(f"│ Max Time Gap           │ {io_analysis['max_gap']:>42.3f}s │")
-            print(f"│ Avg Time Gap           │ {io_analysis['avg_gap']:>42.6f}s │")
+            out.append(f"│ Max Time Gap           │ {io_analysis['max_gap']:>42.3f}s │")
+            out.append(f"│ Avg Time Gap           │ {io_analysis['avg_gap']:>42.6f}s │")
     
-    print("└─────────────────────────────────────────────────────────────────────────────┘")
+    out.append("└─────────────────────────────────────────────────────────────────────────────┘")
     
     # Size distribution
     if read_sizes or write_sizes:
-        print("\n┌─────────────────────────────────────────────────────────────────────────────┐")
-        print("│                           I/O SIZE DISTRIBUTION                             │")
-        print("├─────────────────────────────────────────────────────────────────────────────┤")
+        out.append("\n┌─────────────────────────────────────────────────────────────────────────────┐")
+        out.append("│                           I/O SIZE DISTRIBUTION                             │")
+        out.append("├─────────────────────────────────────────────────────────────────────────────┤")
         
         if read_sizes:
-            print("│                               READ SIZES                                    │")
-            print("├─────────────────────────────────────────────────────────────────────────────┤")
-            read_size_buckets = defaultdict(int)
-            for size in read_sizes:
-                if size <= 4096:
-                    read_size_buckets['≤4KB'] += 1
-                elif size <= 8192:
-                    read_size_buckets['≤8KB'] += 1
-                elif size <= 32768:
-                    read_size_buckets['≤32KB'] += 1
-                elif size <= 65536:
-                    read_size_buckets['≤64KB'] += 1
-                elif size <= 131072:
-                    read_size_buckets['≤128KB'] += 1
-                else:
-                    read_size_buckets['>128KB'] += 1
-            
-            for bucket, count in sorted(read_size_buckets.items(), key=lambda x: ['≤4KB', '≤8KB', '≤32KB', '≤64KB', '≤128KB', '>128KB'].index(x[0])):
+            out.append("│                               READ SIZES                                    │")
+            out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+            for bucket, count in bucket_sizes(read_sizes):
                 percentage = (count / len(read_sizes)) * 100
-                print(f"│ {bucket:<18} │ {count:>8} ({percentage:>5.1f}%) │ {'█' * int(percentage/2):>25} │")
+                out.append(f"│ {bucket:<18} │ {count:>8} ({percentage:>5.1f}%) │ {'█' * int(percentage/2):>25} │")
         
         if write_sizes:
             if read_sizes:
-                print("├─────────────────────────────────────────────────────────────────────────────┤")
-            print("│                              WRITE SIZES                                   │")
-            print("├─────────────────────────────────────────────────────────────────────────────┤")
-            write_size_buckets = defaultdict(int)
-            for size in write_sizes:
-                if size <= 4096:
-                    write_size_buckets['≤4KB'] += 1
-                elif size <= 8192:
-                    write_size_buckets['≤8KB'] += 1
-                elif size <= 32768:
-                    write_size_buckets['≤32KB'] += 1
-                elif size <= 65536:
-                    write_size_buckets['≤64KB'] += 1
-                elif size <= 131072:
-                    write_size_buckets['≤128KB'] += 1
-                else:
-                    write_size_buckets['>128KB'] += 1
-            
-            for bucket, count in sorted(write_size_buckets.items(), key=lambda x: ['≤4KB', '≤8KB', '≤32KB', '≤64KB', '≤128KB', '>128KB'].index(x[0])):
+                out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+            out.append("│                              WRITE SIZES                                   │")
+            out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+            for bucket, count in bucket_sizes(write_sizes):
                 percentage = (count / len(write_sizes)) * 100
-                print(f"│ {bucket:<18} │ {count:>8} ({percentage:>5.1f}%) │ {'█' * int(percentage/2):>25} │")
+                out.append(f"│ {bucket:<18} │ {count:>8} ({percentage:>5.1f}%) │ {'█' * int(percentage/2):>25} │")
         
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
+        out.append("└─────────────────────────────────────────────────────────────────────────────┘")
     
     # Display continuous operations analysis
     if continuous_analysis['read'] or continuous_analysis['write']:
-        print("\n┌─────────────────────────────────────────────────────────────────────────────┐")
-        print("│                        INODES WITH CONTINUOUS OPERATIONS                    │")
-        print("├─────────────────────────────────────────────────────────────────────────────┤")
+        out.append("\n┌─────────────────────────────────────────────────────────────────────────────┐")
+        out.append("│                        INODES WITH CONTINUOUS OPERATIONS                    │")
+        out.append("├─────────────────────────────────────────────────────────────────────────────┤")
         
         if continuous_analysis['read']:
-            print("│                            CONTINUOUS READS                                │")
-            print("├─────────────────────────────────────────────────────────────────────────────┤")
-            print("│ Inode      │ Ops │ Cont% │ Total Bytes │ Top 3 Op Sizes               │")
-            print("├─────────────────────────────────────────────────────────────────────────────┤")
+            out.append("│                            CONTINUOUS READS                                │")
+            out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+            out.append("│ Inode      │ Ops │ Cont% │ Total Bytes │ Top 3 Op Sizes               │")
+            out.append("├─────────────────────────────────────────────────────────────────────────────┤")
             
             # Sort by continuity percentage descending
             sorted_reads = sorted(continuous_analysis['read'], 
                                 key=lambda x: x['continuity_percentage'], reverse=True)
             
             for info in sorted_reads[:10]:  # Show top 10
-                print(f"│ {info['inode']:<10} │ {info['operations']:>3} │ {info['continuity_percentage']:>4.0f}% │ {format_size(info['total_bytes']):>11} │ {info['top_sizes']:<29} │")
+                out.append(f"│ {info['inode']:<10} │ {info['operations']:>3} │ {info['continuity_percentage']:>4.0f}% │ {format_size(info['total_bytes']):>11} │ {info['top_sizes']:<29} │")
         
         if continuous_analysis['write']:
             if continuous_analysis['read']:
-                print("├─────────────────────────────────────────────────────────────────────────────┤")
-            print("│                           CONTINUOUS WRITES                                │")
-            print("├─────────────────────────────────────────────────────────────────────────────┤")
-            print("│ Inode      │ Ops │ Cont% │ Total Bytes │ Top 3 Op Sizes               │")
-            print("├─────────────────────────────────────────────────────────────────────────────┤")
+                out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+            out.append("│                           CONTINUOUS WRITES                                │")
+            out.append("├─────────────────────────────────────────────────────────────────────────────┤")
+            out.append("│ Inode      │ Ops │ Cont% │ Total Bytes │ Top 3 Op Sizes               │")
+            out.append("├─────────────────────────────────────────────────────────────────────────────┤")
             
             # Sort by continuity percentage descending
             sorted_writes = sorted(continuous_analysis['write'], 
                                  key=lambda x: x['continuity_percentage'], reverse=True)
             
             for info in sorted_writes[:10]:  # Show top 10
-                print(f"│ {info['inode']:<10} │ {info['operations']:>3} │ {info['continuity_percentage']:>4.0f}% │ {format_size(info['total_bytes']):>11} │ {info['top_sizes']:<29} │")
+                out.append(f"│ {info['inode']:<10} │ {info['operations']:>3} │ {info['continuity_percentage']:>4.0f}% │ {format_size(info['total_bytes']):>11} │ {info['top_sizes']:<29} │")
         
-        print("└─────────────────────────────────────────────────────────────────────────────┘")
+        out.append("└─────────────────────────────────────────────────────────────────────────────┘")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main entry point for the CLI."""
-    import sys
-    
     if len(sys.argv) != 2:
         print("Usage: oplog-analysis <log_file_path>")
         sys.exit(1)